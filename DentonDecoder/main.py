@@ -10,8 +10,12 @@ matplotlib.use('TkAgg')  # Force TkAgg backend for compatibility
 
 def show_error_dialog(title, message):
     """Display a scrollable error dialog with the full traceback"""
-    # Create a root window
-    root = tk.Tk()
+    # Reuse the running Tk root if there is one instead of starting a second interpreter
+    parent = tk._default_root
+    if parent is not None:
+        root = tk.Toplevel(parent)
+    else:
+        root = tk.Tk()
     root.title(title)
     root.geometry("800x600")  # Larger window for error details
     
@@ -36,7 +40,11 @@ def show_error_dialog(title, message):
     y = (root.winfo_screenheight() // 2) - (height // 2)
     root.geometry(f"{width}x{height}+{x}+{y}")
     
-    root.mainloop()
+    # Wait for the dialog to close without nesting a second event loop
+    if parent is not None:
+        root.wait_window()
+    else:
+        root.mainloop()
     sys.exit(1)  # Exit after showing error
 
 def show_error(exception_type, exception_value, exception_traceback):
@@ -78,6 +86,14 @@ def main():
         # Now try running the actual application
         from src.gui import DentonGUI
         app = DentonGUI()
+        
+        # Handle application close
+        def on_closing():
+            """Stop the worker pool so queued jobs don't keep the process alive"""
+            app.thread_pool.shutdown(wait=False)
+            app.destroy()
+        
+        app.protocol("WM_DELETE_WINDOW", on_closing)
         app.mainloop()
         
     except Exception as e:
@@ -2,7 +2,61 @@ import argparse
 import csv
 import struct
 import os
+import mmap
 import tempfile
+import numpy as np
+
+# Prebuilt unpackers for the little-endian payloads stored in each record
+_DOUBLE = struct.Struct('<d')
+_UINT32 = struct.Struct('<I')
+
+RECORD_SIZE = 128
+TEXT_WIDTH = RECORD_SIZE - 4
+
+# Layout of one record. The payload fields overlap because the tag decides which one applies:
+# 0x08 0x00 <len> 0x00 <text>, 0x05 0x00 <double> or 0x03 0x00 <uint32>
+_RECORD_DTYPE = np.dtype({
+    'names': ['tag', 'flag', 'text_length', 'text_flag', 'double', 'uint32', 'text'],
+    'formats': ['u1', 'u1', 'u1', 'u1', '<f8', '<u4', f'V{TEXT_WIDTH}'],
+    'offsets': [0, 1, 2, 3, 2, 2, 4],
+    'itemsize': RECORD_SIZE,
+})
+
+def _decode_records(data):
+    """
+    Decodes every complete 128 byte record in one vectorized pass.
+    Parameters:
+    data (bytes): Raw contents of the .dat file
+
+    Returns:
+    list: Decoded values (str, float or int) in file order
+    """
+    n_records = len(data) // RECORD_SIZE
+    records = np.frombuffer(data, dtype=_RECORD_DTYPE, count=n_records)
+    
+    # Classify each record by its discriminator bytes
+    tags = records['tag']
+    tagged = records['flag'] == 0x00
+    # Text must also fit inside the record
+    is_text = ((tags == 0x08) & tagged & (records['text_flag'] == 0x00)
+               & (records['text_length'] <= TEXT_WIDTH))
+    is_double = (tags == 0x05) & tagged
+    is_int = (tags == 0x03) & tagged
+    
+    # Field access is a zero-copy strided view; only the selected values are copied out
+    decoded = np.empty(n_records, dtype=object)
+    decoded[is_double] = records['double'][is_double].tolist()
+    decoded[is_int] = records['uint32'][is_int].tolist()
+    
+    # Decode every text payload with a single codec call, then cut each string to its length.
+    # 'replace' maps each invalid byte to one character, so string offsets match byte offsets.
+    text_lengths = records['text_length'][is_text].tolist()
+    text_block = records['text'][is_text].tobytes().decode('ascii', errors='replace')
+    decoded[is_text] = [text_block[k * TEXT_WIDTH:k * TEXT_WIDTH + length]
+                        for k, length in enumerate(text_lengths)]
+    
+    # Records with an unknown tag produce no value
+    return decoded[is_text | is_double | is_int].tolist()
 
 def convertFile(filePath):
     """
@@ -11,7 +65,7 @@ def convertFile(filePath):
     filePath (str): Path to the .dat file
 
     Returns:
-    str: Path to the converted CSV file
+    tuple: (path to the converted CSV file, list of column headers, number of data rows)
     """
     # Check if file exists
     if not os.path.exists(filePath):
@@ -22,9 +76,12 @@ def convertFile(filePath):
         raise PermissionError(f"Cannot read file: {filePath}")
     
     try:
-        # Open the .denton file in binary mode
+        # Map the .denton file read-only instead of copying it into memory
         with open(filePath, 'rb') as f:
-            data = f.read()
+            if os.fstat(f.fileno()).st_size == 0:
+                data = b''  # mmap can't map an empty file
+            else:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except Exception as e:
         raise IOError(f"Failed to read file {filePath}: {str(e)}")
 
@@ -33,65 +90,65 @@ def convertFile(filePath):
     temp_dir = tempfile.gettempdir()
     csvFilePath = os.path.join(temp_dir, f"{filename_base}.csv")
     print(f"Debug: CSV will be written to: {csvFilePath}")
-    decoded_values = []
+    decoded_values = _decode_records(data)
 
-    # Iterate through the data in 128 byte chunks
-    i = 0
-    while i < len(data):
-        # Process the next 128 bytes
-        chunk = data[i:i + 128]
+    # A trailing partial record (if any) is decoded with the scalar path
+    # Work from a memoryview so the record is inspected in place rather than copied out
+    mv = memoryview(data)
+    data_len = len(data)
+    i = len(data) // RECORD_SIZE * RECORD_SIZE
+    while i < data_len:
+        # Number of bytes available in this record
+        chunk_len = min(RECORD_SIZE, data_len - i)
         
-        if len(chunk) >= 4:
+        if chunk_len >= 4:
+            tag = mv[i]
             # Format of 0x08 0x00 0x?? 0x00 means next ?? bytes are chars
-            if chunk[0] == 0x08 and chunk[1] == 0x00 and chunk[3] == 0x00:
-                text_length = chunk[2]
-                if 4 + text_length <= len(chunk):
-                    text = chunk[4:4 + text_length].decode('ascii', errors='replace')
+            if tag == 0x08 and mv[i + 1] == 0x00 and mv[i + 3] == 0x00:
+                text_length = mv[i + 2]
+                if 4 + text_length <= chunk_len:
+                    text = bytes(mv[i + 4:i + 4 + text_length]).decode('ascii', errors='replace')
                     decoded_values.append(text)
             
             # Format of 0x05 0x00 means next 8 bytes are double
-            elif chunk[0] == 0x05 and chunk[1] == 0x00 and len(chunk) >= 10:
+            elif tag == 0x05 and mv[i + 1] == 0x00 and chunk_len >= 10:
                 try:
-                    # Extract the 8 bytes for the double value
-                    double_bytes = chunk[2:10]
-                    # Unpack as little-endian double
-                    double_val = struct.unpack('<d', double_bytes)[0]
+                    # Unpack the 8 bytes after the tag as a little-endian double
+                    double_val = _DOUBLE.unpack_from(mv, i + 2)[0]
                     decoded_values.append(double_val)
                 except struct.error as e:
                     print(f"Error unpacking double at position {i}: {e}")
                     # For debugging, print the bytes
-                    print(f"Bytes: {[hex(b) for b in double_bytes]}")
+                    print(f"Bytes: {[hex(b) for b in mv[i + 2:i + 10]]}")
                     decoded_values.append("ERROR")
             
             # Format of 0x03 0x00 means next 4 bytes are int
-            elif chunk[0] == 0x03 and chunk[1] == 0x00 and len(chunk) >= 6:
+            elif tag == 0x03 and mv[i + 1] == 0x00 and chunk_len >= 6:
                 try:
-                    # Extract the 4 bytes for the int value
-                    int_bytes = chunk[2:6]
-                    # Unpack as little-endian int
-                    int_val = struct.unpack('<I', int_bytes)[0]
+                    # Unpack the 4 bytes after the tag as a little-endian int
+                    int_val = _UINT32.unpack_from(mv, i + 2)[0]
                     decoded_values.append(int_val)
                 except struct.error as e:
                     print(f"Error unpacking int at position {i}: {e}")
                     # For debugging, print the bytes
-                    print(f"Bytes: {[hex(b) for b in int_bytes]}")
+                    print(f"Bytes: {[hex(b) for b in mv[i + 2:i + 6]]}")
                     decoded_values.append("ERROR")
  
-        i += 128
+        i += RECORD_SIZE
+
+    # Every record has been decoded, so the mapping can be released
+    mv.release()
+    if isinstance(data, mmap.mmap):
+        data.close()
 
     # Format the decoded values into a table structure
     # First 27 values become headers, rest become rows of 27 columns each
     headers = decoded_values[:27]
-    data_rows = []
     
-    # Process remaining values into rows of 27 columns each
+    # Pad remaining values with empty strings to a whole number of rows, then reshape into rows of 27 columns
     remaining_values = decoded_values[27:]
-    for i in range(0, len(remaining_values), 27):
-        row = remaining_values[i:i+27]
-        # Pad row with empty strings if needed to ensure 27 columns
-        while len(row) < 27:
-            row.append("")
-        data_rows.append(row)
+    remaining_values.extend([""] * (-len(remaining_values) % 27))
+    data_rows = np.array(remaining_values, dtype=object).reshape(-1, 27).tolist()
 
     # Write content to a csv
     try:
@@ -104,12 +161,22 @@ def convertFile(filePath):
         with open(csvFilePath, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(headers)  # Write headers
-            writer.writerows(data_rows)  # Write data rows
+            
+            # Numeric cells never need quoting, so preformat the data rows and write them in one go.
+            # If any text cell holds a delimiter, quote or line break, let the csv writer quote it.
+            body = '\r\n'.join([','.join(map(str, row)) for row in data_rows])
+            needs_quoting = ('"' in body or body.count(',') != 26 * len(data_rows)
+                             or body.count('\n') != max(len(data_rows) - 1, 0)
+                             or body.count('\r') != max(len(data_rows) - 1, 0))
+            if needs_quoting:
+                writer.writerows(data_rows)  # Write data rows
+            elif data_rows:
+                csvfile.write(body + '\r\n')  # Match the csv writer's line terminator
         print(f"Debug: Successfully wrote CSV file: {csvFilePath}")
     except Exception as e:
         raise IOError(f"Failed to write CSV file {csvFilePath}: {str(e)}")
     
-    return csvFilePath
+    return csvFilePath, headers, len(data_rows)
 
 def main():
     parser = argparse.ArgumentParser(description="Convert .dat files to CSV files")
@@ -129,7 +196,7 @@ def main():
     
     try:
         # Convert the file
-        output_file = convertFile(args.filePath)
+        output_file, _, _ = convertFile(args.filePath)
         
         # If an output path was specified, rename the file
         if args.output:
@@ -1,10 +1,152 @@
 import argparse
-import datetime
 import matplotlib.pyplot as plt
 import numpy as np
 import csv
+import io
+import operator
 from pathlib import Path
 
+def parse_times(time_strs):
+    """
+    Convert an array of H:M:S time strings to seconds since midnight.
+    
+    Args:
+        time_strs: NumPy array of time strings
+    
+    Returns:
+        Tuple of (seconds, valid) arrays; valid is False where a string couldn't be parsed
+        or isn't a time of day
+    """
+    # View each fixed-width HH:MM:SS string as its 8 code points and turn them into digit values
+    chars = time_strs.astype('U8').view(np.uint32).reshape(-1, 8).astype(np.int64) - ord('0')
+    digits = chars[:, [0, 1, 3, 4, 6, 7]]
+    separator = ord(':') - ord('0')
+    valid = ((np.char.str_len(time_strs) == 8)
+             & (chars[:, 2] == separator) & (chars[:, 5] == separator)
+             & ((digits >= 0) & (digits <= 9)).all(axis=1))
+    hms = digits[:, 0::2] * 10 + digits[:, 1::2]
+    
+    # Other widths, e.g. "9:05:03" without a leading zero, are split one by one
+    for i in np.flatnonzero(~valid & (time_strs != '')).tolist():
+        try:
+            hours, minutes, seconds = time_strs[i].split(':')
+            hms[i] = int(hours), int(minutes), int(seconds)
+            valid[i] = True
+        except ValueError:
+            continue
+    
+    valid &= ((hms >= 0) & (hms < [24, 60, 60])).all(axis=1)
+    secs = hms @ np.array([3600, 60, 1])
+    return secs, valid
+
+def parse_values(value_strs):
+    """
+    Convert an array of numeric strings to floats.
+    
+    Args:
+        value_strs: NumPy array of value strings
+    
+    Returns:
+        Tuple of (values, valid) arrays; valid is False where a string couldn't be parsed
+    """
+    values = np.zeros(len(value_strs))
+    # Blank cells (e.g. padding in the last row) are the common failure, so drop them up front
+    valid = value_strs != ''
+    try:
+        values[valid] = value_strs[valid].astype(np.float64)
+    except ValueError:
+        # Fall back to converting one by one when there is a non-numeric entry
+        for i, value_str in zip(np.flatnonzero(valid).tolist(), value_strs[valid].tolist()):
+            try:
+                values[i] = float(value_str)
+            except ValueError:
+                valid[i] = False
+    return values, valid
+
+def downsample_minmax(times, values, max_points=4000):
+    """
+    Reduce a long series to the min and max point of each bin for plotting.
+    Peaks survive, unlike a plain stride, while the line has far fewer segments.
+    
+    Args:
+        times: NumPy array of times
+        values: NumPy array of values
+        max_points: Approximate number of points to keep (default: 4000)
+    
+    Returns:
+        Tuple of (times, values) arrays in original order
+    """
+    n = len(values)
+    if n <= max_points:
+        return times, values
+    
+    # Split into equal bins of whole points; any leftover tail is kept as-is
+    bin_size = -(-n // (max_points // 2))
+    n_binned = n // bin_size * bin_size
+    bins = values[:n_binned].reshape(-1, bin_size)
+    starts = np.arange(0, n_binned, bin_size)
+    
+    keep = np.unique(np.concatenate([
+        starts + bins.argmin(axis=1),
+        starts + bins.argmax(axis=1),
+        np.arange(n_binned, n),
+    ]))
+    return times[keep], values[keep]
+
+def read_rows(f, max_col=-1):
+    """
+    Split the remaining lines of an open CSV file into rows.
+    Files without quoted fields are split on commas directly, which is much
+    faster than csv.reader; anything quoted still goes through the csv module.
+    
+    Args:
+        f: Text file object, e.g. positioned after the header row
+        max_col: Highest column index needed; later fields may be left unsplit (default: all)
+    
+    Returns:
+        Iterable of rows, each a list of field strings
+    """
+    text = f.read()
+    if '"' in text:
+        return csv.reader(io.StringIO(text))
+    max_split = max_col + 1 if max_col >= 0 else -1
+    return (line.split(',', max_split) for line in text.split('\n') if line)
+
+def read_series(csv_reader, data_col, time_col=0):
+    """
+    Read a value column vs time from the remaining rows of a CSV reader.
+    
+    Args:
+        csv_reader: Rows after the header, from read_rows or a csv.reader
+        data_col: Index of the value column
+        time_col: Index of the HH:MM:SS time column (default: 0)
+    
+    Returns:
+        Tuple of (times, values) NumPy arrays, with times in seconds since the first timestamp.
+        Rows where either column can't be parsed are skipped.
+    """
+    # Pull the time and value columns out of every long enough row in one pass
+    get_columns = operator.itemgetter(time_col, data_col)
+    columns = [get_columns(row) for row in csv_reader if len(row) > max(time_col, data_col)]
+    
+    columns = np.array(columns, dtype=str).reshape(-1, 2)
+    time_strs, value_strs = columns[:, 0], columns[:, 1]
+    
+    # Convert both columns in bulk
+    time_secs, time_valid = parse_times(time_strs)
+    values, value_valid = parse_values(value_strs)
+    
+    if not time_valid.any():
+        return np.zeros(0), np.zeros(0)
+    
+    # Calculate seconds since the first parsable timestamp
+    base_time = time_secs[time_valid][0]
+    times = time_secs - base_time
+    times[times < 0] += 24 * 60 * 60  # Handle crossing midnight
+    
+    keep = time_valid & value_valid
+    return times[keep], values[keep]
+
 def create_graph(input_file, column_name="Chamber Pressure (Torr)", output_file=None, show_graph=True, log_scale=False, return_data=False):
     """
     Create a graph of a selected column vs time from a CSV log file.
@@ -18,7 +160,7 @@ def create_graph(input_file, column_name="Chamber Pressure (Torr)", output_file=
         return_data: If True, returns (times, values) tuple instead of plotting (default: False)
     
     Returns:
-        If return_data=True: tuple of (times, values)
+        If return_data=True: tuple of (times, values) NumPy arrays
         If return_data=False: Boolean indicating success
     """
     try:
@@ -38,58 +180,19 @@ def create_graph(input_file, column_name="Chamber Pressure (Torr)", output_file=
                 print(f"Available columns: {', '.join(headers)}")
                 return ([], []) if return_data else False
             
-            # Data structures for the graph
-            times = []
-            values = []
-            
-            # Base time to convert timestamps to relative seconds
-            base_time = None
-            
-            # Process each line
-            for row in csv_reader:
-                if not row or len(row) <= data_col:
-                    continue
-                
-                # Extract timestamp
-                time_str = row[time_col]
-                try:
-                    # Convert time string to datetime object
-                    time_obj = datetime.datetime.strptime(time_str, "%H:%M:%S")
-                    
-                    # Set base time if not set
-                    if base_time is None:
-                        base_time = time_obj
-                    
-                    # Calculate seconds since base time
-                    time_delta = (time_obj - base_time).total_seconds()
-                    if time_delta < 0:  # Handle crossing midnight
-                        time_delta += 24 * 60 * 60
-                        
-                    # Extract value from the selected column
-                    try:
-                        value = float(row[data_col])
-                        
-                        # Add to data lists
-                        times.append(time_delta)
-                        values.append(value)
-                    except ValueError:
-                        # Skip if value can't be converted to float
-                        continue
-                except ValueError:
-                    # Skip if time can't be parsed
-                    continue
+            times, values = read_series(read_rows(f, max(data_col, time_col)), data_col, time_col)
         
         # If we're just returning data, do that now
         if return_data:
             return (times, values)
             
         # Create the graph if we have data
-        if times and values:
+        if len(times) and len(values):
             # Create figure and axis
             fig, ax = plt.figure(figsize=(10, 6)), plt.gca()
             
-            # Plot the data
-            ax.plot(times, values)
+            # Plot the data, reduced to a min/max envelope for long logs
+            ax.plot(*downsample_minmax(times, values))
             
             # Add labels and title
             ax.set_xlabel('Time (seconds since start)')
@@ -4,12 +4,18 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import os
 import re
+import math
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import sys
 import csv
 import random
 import colorsys
+import hashlib
+import tempfile
+import numpy as np
 
 # Add the parent directory to the path to find modules correctly
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -19,7 +25,7 @@ if parent_dir not in sys.path:
 
 # Import from the Denton modules - use relative or absolute imports based on your structure
 from src.DentonDecoder import convertFile
-from src.DentonGrapher import create_graph
+from src.DentonGrapher import create_graph, downsample_minmax, read_rows, read_series
 
 class DentonGUI(tk.Tk):
     def __init__(self):
@@ -31,11 +37,23 @@ class DentonGUI(tk.Tk):
         
         # Store file information as a list of dictionaries with original path, csv path, and columns
         self.files = []
+        self.file_paths = set()  # Original paths in self.files, for duplicate checks
+        self.files_by_tree_id = {}  # Map from file list row to its entry in self.files
         self.columns = []
+        self.common_columns = None  # Columns shared by all ready files, None until one is ready
         
         # Generate distinct colors for plots
         self.color_cycle = self.generate_distinct_colors(20)  # Generate 20 distinct colors
         
+        # Pair each color with a line style and marker for additional distinctiveness,
+        # over enough entries that every combination of the three cycles appears
+        line_styles = ['-', '--', '-.', ':']
+        markers = ['o', 's', '^', 'D', 'v', '*', 'p', 'h', '+', 'x']
+        style_count = math.lcm(len(self.color_cycle), len(line_styles), len(markers))
+        self.style_cycle = [(self.color_cycle[i % len(self.color_cycle)],
+                             line_styles[i % len(line_styles)],
+                             markers[i % len(markers)]) for i in range(style_count)]
+        
         # Track the selected file for time offset (index in file_data)
         self.selected_file_index = 0
         
@@ -46,12 +64,30 @@ class DentonGUI(tk.Tk):
         self.current_file_data = []
         self.current_column = ""
         self.current_log_scale = False
+        self.max_duration = 300.0  # Longest duration in current_file_data, for the slider range
         
         # Variables for zoom functionality
         self.zoom_rect = None
         self.zooming = False
         self.original_xlim = None
         self.original_ylim = None
+        self.plot_lines = {}  # Map from file index to (Line2D, unshifted times, x data buffer, label)
+        self.time_points = np.zeros(0)  # Offset times of all plotted points, for the x-axis limits
+        self.time_spans = {}  # Map from file index to (unshifted times, slice of time_points)
+        self.slider_job = None  # Pending offset update while the slider is dragged
+        self.plot_signature = None  # What the current plot shows, to skip needless rebuilds
+        self.layout_key = None  # (column, log scale) the figure layout was last fitted for
+        
+        # Reuse a small set of worker threads for conversions and graph loading
+        self.thread_pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Cache parsed (times, values) per (csv path, modification time and size, column), oldest evicted first
+        self.parsed_data_cache = OrderedDict()
+        self.max_cached_series = 64
+        
+        # Keep parsed series on disk too, so files graphed in an earlier session load without parsing
+        self.disk_cache_dir = os.path.join(tempfile.gettempdir(), "DentonDecoder_cache")
+        self.max_disk_cache_bytes = 1 << 30  # 1 GiB, oldest files removed first
         
         self.create_widgets()
         
@@ -205,7 +241,7 @@ class DentonGUI(tk.Tk):
             to=300.0, 
             variable=self.time_offset_var, 
             orient=tk.HORIZONTAL,
-            command=self.update_time_offset
+            command=self.on_slider_moved
         )
         self.time_offset_slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
@@ -277,7 +313,7 @@ class DentonGUI(tk.Tk):
         # Process each selected file
         for filename in filenames:
             # Check if file is already in the list
-            if any(file_info['original_path'] == filename for file_info in self.files):
+            if filename in self.file_paths:
                 messagebox.showinfo("Info", f"File already added: {os.path.basename(filename)}")
                 continue
                 
@@ -285,7 +321,8 @@ class DentonGUI(tk.Tk):
                 'original_path': filename,
                 'csv_path': None,
                 'columns': [],
-                'tree_id': None
+                'tree_id': None,
+                'status': "Pending"
             }
             
             # Insert into the file list
@@ -296,6 +333,8 @@ class DentonGUI(tk.Tk):
             file_info['tree_id'] = tree_id
             
             self.files.append(file_info)
+            self.file_paths.add(filename)
+            self.files_by_tree_id[tree_id] = file_info
             
             # Process file based on its extension
             if file_ext == '.dat':
@@ -304,7 +343,7 @@ class DentonGUI(tk.Tk):
             elif file_ext == '.csv':
                 file_info['csv_path'] = filename
                 self.load_csv_columns(file_info)
-                self.file_list.item(tree_id, values=(file_base, file_ext, "Ready"))
+                self.set_file_status(file_info, "Ready")
     
     def remove_selected_files(self):
         """Remove selected files from the list"""
@@ -313,13 +352,16 @@ class DentonGUI(tk.Tk):
             return
             
         for item in selected_items:
-            # Find and remove file from self.files
-            file_info = next((f for f in self.files if f['tree_id'] == item), None)
+            # Find the file for this row; self.files is filtered once afterwards
+            file_info = self.files_by_tree_id.pop(item, None)
             if file_info:
-                self.files.remove(file_info)
-            
-            # Remove from treeview
-            self.file_list.delete(item)
+                self.file_paths.discard(file_info['original_path'])
+                self.clear_cache_for_file(file_info['csv_path'])
+        
+        self.files = [f for f in self.files if f['tree_id'] in self.files_by_tree_id]
+        
+        # Remove from treeview
+        self.file_list.delete(*selected_items)
             
         # Update column dropdown in case removed files affected available columns
         self.update_common_columns()
@@ -328,17 +370,18 @@ class DentonGUI(tk.Tk):
         """Clear all files from the list"""
         self.file_list.delete(*self.file_list.get_children())
         self.files = []
+        self.file_paths.clear()
+        self.files_by_tree_id.clear()
+        self.common_columns = None
         self.columns = []
         self.column_dropdown['values'] = []
+        self.parsed_data_cache.clear()
     
     def process_dat_file(self, file_info):
         """Process a .dat file by converting it to CSV"""
         filename = file_info['original_path']
-        tree_id = file_info['tree_id']
         
-        self.file_list.item(tree_id, values=(os.path.basename(filename), 
-                                            os.path.splitext(filename)[1], 
-                                            "Converting..."))
+        self.set_file_status(file_info, "Converting...")
         
         def conversion_thread():
             try:
@@ -352,8 +395,11 @@ class DentonGUI(tk.Tk):
                 if not os.path.exists(filename):
                     raise FileNotFoundError(f"File does not exist: {filename}")
                 
-                csv_file = convertFile(filename)
+                csv_file, headers, row_count = convertFile(filename)
                 file_info['csv_path'] = csv_file
+                file_info['columns'] = headers
+                # Calculate duration in seconds (0.85 times row count)
+                file_info['duration'] = row_count / 0.85
                 
                 # Update UI from main thread
                 self.after(10, lambda: self.conversion_complete(file_info))
@@ -361,75 +407,92 @@ class DentonGUI(tk.Tk):
                 print(f"Conversion error: {str(e)}")
                 print(f"Error type: {type(e).__name__}")
                 error_msg = f"Error: {str(e)[:50]}..."
-                self.after(10, lambda: self.file_list.item(tree_id, 
-                                                         values=(os.path.basename(filename), 
-                                                               os.path.splitext(filename)[1], 
-                                                               error_msg)))
+                self.after(10, lambda: self.set_file_status(file_info, error_msg))
         
-        threading.Thread(target=conversion_thread).start()
+        self.thread_pool.submit(conversion_thread)
     
     def conversion_complete(self, file_info):
         """Called when DAT to CSV conversion is complete"""
-        tree_id = file_info['tree_id']
-        filename = file_info['original_path']
+        # Columns and duration come from the conversion itself, so the CSV isn't re-read
+        self.update_common_columns(file_info)
         
-        self.file_list.item(tree_id, values=(os.path.basename(filename), 
-                                            os.path.splitext(filename)[1], 
-                                            "Converted"))
-                                            
-        # Load columns from the converted CSV
-        self.load_csv_columns(file_info)
+        self.set_file_status(file_info, "Ready")
     
     def load_csv_columns(self, file_info):
         """Load column names from a CSV file"""
         try:
-            with open(file_info['csv_path'], 'r', errors='replace') as f:
-                reader = csv.reader(f)
-                file_info['columns'] = next(reader)  # Get header row
+            with open(file_info['csv_path'], 'rb') as f:
+                # Get header row; only quoted headers need the csv module
+                header = f.readline().decode(errors='replace').rstrip('\r\n')
+                if not header:
+                    raise ValueError("No header row")
+                if '"' in header:
+                    file_info['columns'] = next(csv.reader([header]))
+                else:
+                    file_info['columns'] = header.split(',')
                 
-                # Count rows to calculate duration
-                row_count = sum(1 for _ in reader)
-                # Calculate duration in seconds (0.85 times row count)
-                file_info['duration'] = row_count / 0.85
+                # Count rows to calculate duration by scanning the raw bytes for line
+                # ends, which is much cheaper than parsing every field
+                row_count = 0
+                last_byte = b'\n'
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    row_count += chunk.count(b'\n')
+                    last_byte = chunk[-1:]
+                if last_byte != b'\n':
+                    row_count += 1  # Last row has no line end
+            
+            # Calculate duration in seconds (0.85 times row count)
+            file_info['duration'] = row_count / 0.85
                 
             # Update common columns across all files
-            self.update_common_columns()
+            self.update_common_columns(file_info)
             
             # Update status
-            self.file_list.item(file_info['tree_id'], 
-                              values=(os.path.basename(file_info['original_path']), 
-                                    os.path.splitext(file_info['original_path'])[1], 
-                                    "Ready"))
+            self.set_file_status(file_info, "Ready")
                                     
         except Exception as e:
-            self.file_list.item(file_info['tree_id'], 
-                              values=(os.path.basename(file_info['original_path']), 
+            self.set_file_status(file_info, f"Error: {str(e)[:20]}...")
+    
+    def set_file_status(self, file_info, status):
+        """Show a file's status in the list, keeping a copy on file_info so it can be checked without Tk"""
+        file_info['status'] = status
+        self.file_list.item(file_info['tree_id'], 
+                            values=(os.path.basename(file_info['original_path']), 
                                     os.path.splitext(file_info['original_path'])[1], 
-                                    f"Error: {str(e)[:20]}..."))
+                                    status))
     
-    def update_common_columns(self):
-        """Update the dropdown with columns that exist in all files"""
-        if not self.files:
-            self.columns = []
-            self.column_dropdown['values'] = []
-            return
+    def update_common_columns(self, new_file=None):
+        """
+        Update the dropdown with columns that exist in all files, in header order.
+        Pass a newly ready file to just narrow the current set by its columns
+        instead of intersecting every file again.
+        """
+        if new_file is not None and self.common_columns is not None:
+            # Skip files that were removed while they were still converting
+            if new_file['original_path'] in self.file_paths and new_file['csv_path'] and new_file['columns']:
+                self.common_columns &= set(new_file['columns'])
+            self.columns = [column for column in self.columns if column in self.common_columns]
+        else:
+            # Get common columns across all ready files
+            ready_files = [f for f in self.files if f['csv_path'] and f['columns']]
             
-        # Get common columns across all ready files
-        ready_files = [f for f in self.files if f['csv_path'] and f['columns']]
-        
-        if not ready_files:
-            self.columns = []
-            self.column_dropdown['values'] = []
-            return
+            if not ready_files:
+                self.common_columns = None
+                self.columns = []
+                self.column_dropdown['values'] = []
+                return
+                
+            # Start with all columns from the first file
+            self.common_columns = set(ready_files[0]['columns'])
             
-        # Start with all columns from the first file
-        common_columns = set(ready_files[0]['columns'])
-        
-        # Find intersection with columns from other files
-        for file_info in ready_files[1:]:
-            common_columns &= set(file_info['columns'])
+            # Find intersection with columns from other files
+            for file_info in ready_files[1:]:
+                self.common_columns &= set(file_info['columns'])
+            
+            # Keep the first file's header order, which groups related readings
+            self.columns = [column for column in dict.fromkeys(ready_files[0]['columns'])
+                            if column in self.common_columns]
         
-        self.columns = sorted(list(common_columns))
         self.column_dropdown['values'] = self.columns
         
         # Set default column if available
@@ -442,7 +505,7 @@ class DentonGUI(tk.Tk):
     def generate_graph(self):
         """Generate and display graphs for selected files"""
         # Check if any files are ready
-        ready_files = [f for f in self.files if f['csv_path'] and 'Ready' in self.file_list.item(f['tree_id'])['values'][2]]
+        ready_files = [f for f in self.files if f['csv_path'] and 'Ready' in f['status']]
         
         if not ready_files:
             messagebox.showerror("Error", "No files ready for graphing")
@@ -455,103 +518,165 @@ class DentonGUI(tk.Tk):
             
         log_scale = self.log_scale_var.get()
         
-        # Clear previous graph
-        self.ax.clear()
+        # The previous graph stays up until update_plot replaces it
         self.status_var.set(f"Generating graphs for {column}...")
         self.update_idletasks()
         
-        # Process each file in separate threads to keep UI responsive
-        file_data = []  # Will store (file_info, times, values) tuples
-        lock = threading.Lock()
-        threads = []
-        
-        def process_file_thread(file_info, file_index):
+        # Process each file on the worker pool to keep UI responsive
+        def process_file_thread(file_info):
+            """Return (times, values) for one file, or None if it can't be graphed"""
             try:
                 # Extract data from the file
                 csv_path = file_info['csv_path']
                 
+                # Use the copy saved to disk by an earlier session if the source file is unchanged
+                disk_cache_path = self.get_disk_cache_path(file_info, column)
+                cached = self.load_disk_cache(disk_cache_path)
+                if cached is not None:
+                    return cached
+                
                 # Read the CSV and extract the data for the selected column
-                times, values = [], []
-                row_count = 0
+                # The header was already parsed into file_info['columns'] when the file was loaded
+                try:
+                    col_index = file_info['columns'].index(column)
+                except ValueError:
+                    self.after(10, lambda: messagebox.showerror("Error", 
+                                                             f"Column '{column}' not found in {os.path.basename(csv_path)}"))
+                    return None
                 
                 with open(csv_path, 'r', errors='replace') as f:
-                    csv_reader = csv.reader(f)
-                    headers = next(csv_reader)
+                    f.readline()  # Skip header row
                     
-                    try:
-                        col_index = headers.index(column)
-                        time_col = 0  # Assuming time is in the first column
-                        
-                        # Base time to convert timestamps to relative seconds
-                        base_time = None
-                        
-                        for row in csv_reader:
-                            row_count += 1
-                            if not row or len(row) <= col_index:
-                                continue
-                                
-                            # Extract timestamp
-                            time_str = row[time_col]
-                            try:
-                                # Convert time string to datetime object
-                                import datetime
-                                time_obj = datetime.datetime.strptime(time_str, "%H:%M:%S")
-                                
-                                # Set base time if not set
-                                if base_time is None:
-                                    base_time = time_obj
-                                
-                                # Calculate seconds since base time
-                                time_delta = (time_obj - base_time).total_seconds()
-                                if time_delta < 0:  # Handle crossing midnight
-                                    time_delta += 24 * 60 * 60
-                                    
-                                # Extract value
-                                try:
-                                    value = float(row[col_index])
-                                    times.append(time_delta)
-                                    values.append(value)
-                                except ValueError:
-                                    # Skip if value can't be converted to float
-                                    continue
-                            except ValueError:
-                                # Skip if time can't be parsed
-                                continue
-                        
-                        # Calculate duration from row count if not already set
-                        if 'duration' not in file_info:
-                            file_info['duration'] = row_count / 0.85
-                        
-                    except ValueError:
-                        self.after(10, lambda: messagebox.showerror("Error", 
-                                                                 f"Column '{column}' not found in {os.path.basename(csv_path)}"))
-                        return
+                    # Parse times (seconds since start) and values in bulk
+                    times, values = read_series(read_rows(f, col_index), col_index)
                 
-                with lock:
-                    file_data.append((file_info, times, values))
+                # Single precision covers the logged resolution at half the memory
+                # to cache and move through each redraw
+                times, values = times.astype(np.float32), values.astype(np.float32)
+                self.save_disk_cache(disk_cache_path, times, values)
+                return times, values
                 
             except Exception as e:
                 self.after(10, lambda: messagebox.showerror("Error", 
                                                          f"Failed to process {os.path.basename(file_info['original_path'])}: {str(e)}"))
+                return None
+        
+        # Reuse parsed data for files that haven't changed since they were last graphed,
+        # and queue a job on the shared worker pool for each of the others
+        cache_keys = {}
+        results = {}  # Map from csv path to cached (times, values) or a pending Future
+        for file_info in ready_files:
+            csv_path = file_info['csv_path']
+            cache_keys[csv_path] = self.get_cache_key(file_info, column)
+            if cache_keys[csv_path] in self.parsed_data_cache:
+                self.parsed_data_cache.move_to_end(cache_keys[csv_path])
+                results[csv_path] = self.parsed_data_cache[cache_keys[csv_path]]
+            else:
+                results[csv_path] = self.thread_pool.submit(process_file_thread, file_info)
         
-        # Start a thread for each file
-        for i, file_info in enumerate(ready_files):
-            thread = threading.Thread(target=process_file_thread, args=(file_info, i))
-            threads.append(thread)
-            thread.start()
-        
-        # Define function to update the plot when all threads complete
-        def update_plot_when_ready():
-            # Check if all threads are done
-            if any(t.is_alive() for t in threads):
-                self.after(100, update_plot_when_ready)  # Check again in 100ms
-                return
+        def finish_graph():
+            """Collect results in file order on the main thread and plot them"""
+            file_data = []  # Will store (file_info, times, values) tuples
+            for file_info in ready_files:
+                csv_path = file_info['csv_path']
+                result = results[csv_path]
+                if isinstance(result, Future):
+                    result = result.result()
+                    if result is None:
+                        continue
+                    # Cache what was parsed for the next graph
+                    self.cache_parsed_data(cache_keys[csv_path], *result)
+                file_data.append((file_info, *result))
             
-            # All threads are done, update the plot
             self.update_plot(file_data, column, log_scale)
         
-        # Start checking for thread completion
-        update_plot_when_ready()
+        # Hand back to the Tk main loop as soon as the last job finishes
+        futures = [result for result in results.values() if isinstance(result, Future)]
+        if not futures:
+            finish_graph()
+            return
+        
+        lock = threading.Lock()
+        remaining = [len(futures)]
+        
+        def on_job_done(_):
+            with lock:
+                remaining[0] -= 1
+                last_job = remaining[0] == 0
+            if last_job:
+                self.after(0, finish_graph)
+        
+        for future in futures:
+            future.add_done_callback(on_job_done)
+
+    def get_cache_key(self, file_info, column):
+        """Build the parsed data cache key; it changes whenever the CSV is rewritten"""
+        csv_path = file_info['csv_path']
+        try:
+            stat = os.stat(csv_path)
+            version = (stat.st_mtime, stat.st_size)
+        except OSError:
+            version = None
+        return (csv_path, version, column)
+    
+    def cache_parsed_data(self, cache_key, times, values):
+        """Store parsed data, evicting the least recently used entries past the limit"""
+        self.parsed_data_cache[cache_key] = (times, values)
+        self.parsed_data_cache.move_to_end(cache_key)
+        while len(self.parsed_data_cache) > self.max_cached_series:
+            self.parsed_data_cache.popitem(last=False)
+    
+    def clear_cache_for_file(self, csv_path):
+        """Drop cached data for a specific CSV file"""
+        for cache_key in [key for key in self.parsed_data_cache if key[0] == csv_path]:
+            del self.parsed_data_cache[cache_key]
+    
+    def get_disk_cache_path(self, file_info, column):
+        """Path of the on-disk copy of a parsed column, named after the source file's path, mtime and size"""
+        # Key on the original file, since .dat files are converted to a fresh CSV every session
+        source_path = os.path.abspath(file_info['original_path'])
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        key = f"{source_path}|{stat.st_mtime}|{stat.st_size}|{column}"
+        return os.path.join(self.disk_cache_dir, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + ".npz")
+    
+    def load_disk_cache(self, cache_path):
+        """Load (times, values) saved by save_disk_cache, or None if there is no usable copy"""
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            with np.load(cache_path) as data:
+                times, values = data['times'], data['values']
+            os.utime(cache_path)  # Mark as recently used so it is evicted last
+            return times, values
+        except Exception:
+            return None
+    
+    def save_disk_cache(self, cache_path, times, values):
+        """Save parsed data to disk, then remove the oldest files once the cache is over budget"""
+        if cache_path is None:
+            return
+        try:
+            os.makedirs(self.disk_cache_dir, exist_ok=True)
+            # Write under a temporary name so a concurrent reader never sees a partial file
+            temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                np.savez(f, times=times, values=values)
+            os.replace(temp_path, cache_path)
+            
+            entries = [entry for entry in os.scandir(self.disk_cache_dir) if entry.name.endswith(".npz")]
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            total_size = sum(entry.stat().st_size for entry in entries)
+            for entry in entries:
+                if total_size <= self.max_disk_cache_bytes:
+                    break
+                total_size -= entry.stat().st_size
+                os.remove(entry.path)
+        except OSError as e:
+            # The disk cache is only an optimization, so carry on without it
+            print(f"Could not update parsed data cache: {str(e)}")
 
     def update_plot(self, file_data, column, log_scale, apply_offset=False):
         """Update the plot with data from multiple files"""
@@ -565,6 +690,9 @@ class DentonGUI(tk.Tk):
             self.current_column = column
             self.current_log_scale = log_scale
             
+            # Find the longest file duration once per set of files
+            self.max_duration = max([f_info['duration'] for f_info, _, _ in file_data if 'duration' in f_info] + [300.0])
+            
             # Update file selector dropdown with file names
             file_names = [os.path.basename(info[0]['original_path']) for info in file_data]
             self.file_selector['values'] = file_names
@@ -578,16 +706,10 @@ class DentonGUI(tk.Tk):
                 selected_file_info = file_data[0][0]
                 current_file_duration = selected_file_info.get('duration', 300.0)
                 
-                # Find the longest file duration
-                max_duration = 300.0  # Default fallback
-                for f_info, _, _ in file_data:
-                    if 'duration' in f_info and f_info['duration'] > max_duration:
-                        max_duration = f_info['duration']
-                
                 # Update slider range
                 self.time_offset_slider.configure(
                     from_=-current_file_duration,
-                    to=max_duration
+                    to=self.max_duration
                 )
                 
                 # Show current offset for the selected file
@@ -595,60 +717,58 @@ class DentonGUI(tk.Tk):
                 current_offset = self.file_offsets.get(file_path, 0.0)
                 self.time_offset_var.set(current_offset)
             
-        try:
-            # Clear previous graph
-            self.ax.clear()
-            
-            # Define line styles and markers for additional distinctiveness
-            line_styles = ['-', '--', '-.', ':']
-            markers = ['o', 's', '^', 'D', 'v', '*', 'p', 'h', '+', 'x']
+        # Identify what is drawn; offsets are left out since lines can be moved in place
+        plot_signature = (column, log_scale, self.auto_zoom_var.get(),
+                          tuple((info['original_path'], id(times), id(values))
+                                for info, times, values in file_data))
+        if plot_signature == self.plot_signature:
+            # Same data already drawn, so just bring offsets and zoom up to date
+            for i, (file_info, _, _) in enumerate(file_data):
+                if i in self.plot_lines:
+                    self.move_line(i, self.file_offsets.get(file_info['original_path'], 0.0))
+            self.ax.set_ylim(self.original_ylim)
+            self.redraw_offsets()
             
-            # Track the full time range across all files
-            all_min_time = float('inf')
-            all_max_time = float('-inf')
+            if not apply_offset:
+                self.status_var.set(f"Graph generated for {column} with {len(file_data)} files")
+            return
+        
+        try:
+            # Reuse the previous graph's lines for files that are still plotted,
+            # rather than clearing and rebuilding the whole axes
+            old_lines = {line.get_gid(): line for line in self.ax.lines}
+            self.plot_lines = {}
+            self.time_spans = {}
+            self.plot_signature = None
             
             # Track time range of data points (not just endpoints)
-            active_data_points = []
-            
-            # First pass - calculate time ranges and collect active data points
-            for i, (file_info, times, values) in enumerate(file_data):
-                if not times or not values:
-                    continue
-                    
-                # Get the offset for this file
-                file_path = file_info['original_path']
-                offset = self.file_offsets.get(file_path, 0.0)
-                
-                # Calculate min and max times considering offset
-                if times:
-                    file_min = min(times) + offset
-                    file_max = max(times) + offset
-                    all_min_time = min(all_min_time, file_min)
-                    all_max_time = max(all_max_time, file_max)
-                    
-                    # Collect all time points for active data calculation
-                    active_data_points.extend([t + offset for t in times])
+            offset_times = []
+            point_count = 0
             
             # Plot each file's data
             for i, (file_info, times, values) in enumerate(file_data):
-                if not times or not values:
+                if len(times) == 0 or len(values) == 0:
                     continue
                     
                 # Get the offset for this file (if any)
                 file_path = file_info['original_path']
                 offset = self.file_offsets.get(file_path, 0.0)
                 
-                # Apply time offset if needed
-                adjusted_times = [t + offset for t in times]
+                times = np.asarray(times)
+                offset_times.append(times + offset)
+                self.time_spans[i] = (times, slice(point_count, point_count + len(times)))
+                point_count += len(times)
+                
+                # Keep only the peaks of long series since the axes can't show
+                # more points than it has pixels
+                plot_times, values = downsample_minmax(times, np.asarray(values))
                     
                 filename = os.path.basename(file_info['original_path'])
                 # Shorten label: extract "Run#XXXX" from filenames like "Event_Log_Run#1094 ...dat"
                 run_match = re.search(r'Run#\d+', filename)
                 short_label = run_match.group(0) if run_match else filename
                 
-                color = self.color_cycle[i % len(self.color_cycle)]
-                line_style = line_styles[i % len(line_styles)]
-                marker = markers[i % len(markers)]
+                color, line_style, marker = self.style_cycle[i % len(self.style_cycle)]
                 
                 # Include duration in the label if available
                 duration_text = ""
@@ -656,11 +776,9 @@ class DentonGUI(tk.Tk):
                     duration_text = f" ({file_info['duration']:.1f}s)"
                 
                 # Use different marker frequency based on data length
-                marker_every = max(len(times) // 20, 1) if len(times) > 20 else None
+                marker_every = max(len(values) // 20, 1) if len(values) > 20 else None
                 
-                self.ax.plot(
-                    adjusted_times, 
-                    values, 
+                line_props = dict(
                     label=f"{short_label}{duration_text} [offset: {offset:.1f}s]" if offset != 0 else f"{short_label}{duration_text}", 
                     color=color,
                     linestyle=line_style,
@@ -668,6 +786,15 @@ class DentonGUI(tk.Tk):
                     markevery=marker_every,
                     markersize=5
                 )
+                line = old_lines.pop(file_path, None)
+                if line is not None:
+                    line.set_data(plot_times + offset, values)
+                    line.set(**line_props)
+                else:
+                    line, = self.ax.plot(plot_times + offset, values, gid=file_path, **line_props)
+                
+                # Keep the line and its unshifted times so offset changes can move it in place
+                self.plot_lines[i] = (line, plot_times, np.empty_like(plot_times), f"{short_label}{duration_text}")
             
             # Configure plot
             self.ax.set_xlabel("Time (seconds since start)")
@@ -675,48 +802,33 @@ class DentonGUI(tk.Tk):
             self.ax.set_title(f"{column} vs Time")
             self.ax.grid(True)
             
+            # Drop lines of files that are no longer plotted
+            for line in old_lines.values():
+                line.remove()
+            
             if log_scale:
                 self.ax.set_yscale("log")
             else:
                 self.ax.set_yscale("linear")
             
-            # Add legend with smaller font if there are many files
-            if len(file_data) > 5:
-                self.ax.legend(fontsize='small', loc='best')
-            else:
-                self.ax.legend(loc='best')
-            
-            # Set x-axis limits with intelligent padding
-            if active_data_points and all_min_time != float('inf') and all_max_time != float('-inf'):
-                if hasattr(self, 'auto_zoom_var') and self.auto_zoom_var.get():
-                    # Auto-zoom to focus on the data density
-                    # Sort all data points and find 5th and 95th percentiles to focus on main data
-                    sorted_times = sorted(active_data_points)
-                    lower_idx = max(0, int(len(sorted_times) * 0.05))
-                    upper_idx = min(len(sorted_times) - 1, int(len(sorted_times) * 0.95))
-                    
-                    focus_min = sorted_times[lower_idx]
-                    focus_max = sorted_times[upper_idx]
-                    focus_range = focus_max - focus_min
-                    
-                    # Add padding
-                    padding = focus_range * 0.1
-                    self.ax.set_xlim(focus_min - padding, focus_max + padding)
-                    
-                else:
-                    # Show all data with padding
-                    time_range = all_max_time - all_min_time
-                    padding = max(time_range * 0.05, 1.0)  # At least 1 second padding
-                    self.ax.set_xlim(all_min_time - padding, all_max_time + padding)
+            # Fit the y-axis to the new data, undoing any previous zoom
+            self.ax.relim()
+            self.ax.autoscale(enable=True, axis='y')
             
-            # Force a complete redraw of the canvas
-            self.figure.tight_layout()
-            self.canvas.draw()
-            self.canvas.flush_events()
+            self.update_legend()
+            self.time_points = np.concatenate(offset_times) if offset_times else np.zeros(0)
+            self.set_time_limits()
+            
+            # Only labels and tick format change the layout, so skip the layout engine otherwise
+            if (column, log_scale) != self.layout_key:
+                self.figure.tight_layout()
+                self.layout_key = (column, log_scale)
+            self.canvas.draw_idle()
             
             # Store original limits for zoom reset
             self.original_xlim = self.ax.get_xlim()
             self.original_ylim = self.ax.get_ylim()
+            self.plot_signature = plot_signature
             
             if not apply_offset:
                 self.status_var.set(f"Graph generated for {column} with {len(file_data)} files")
@@ -727,6 +839,40 @@ class DentonGUI(tk.Tk):
             messagebox.showerror("Error", f"Failed to update plot: {str(e)}\n\n{error_details}")
             self.status_var.set("Error: Plot update failed")
 
+    def update_legend(self):
+        """Add legend with smaller font if there are many files"""
+        # Pass the lines in file order since reused lines keep their old place in the axes
+        handles = [entry[0] for entry in self.plot_lines.values()]
+        if len(self.current_file_data) > 5:
+            self.ax.legend(handles=handles, fontsize='small', loc='best')
+        else:
+            self.ax.legend(handles=handles, loc='best')
+
+    def set_time_limits(self):
+        """Set x-axis limits with intelligent padding around the offset times of all plotted points"""
+        active_data_points = self.time_points
+        if len(active_data_points):
+            if hasattr(self, 'auto_zoom_var') and self.auto_zoom_var.get():
+                # Auto-zoom to focus on the data density
+                # Find the 5th and 95th percentiles in linear time to focus on main data
+                lower_idx = max(0, int(len(active_data_points) * 0.05))
+                upper_idx = min(len(active_data_points) - 1, int(len(active_data_points) * 0.95))
+                
+                focus_min, focus_max = np.partition(active_data_points, (lower_idx, upper_idx))[[lower_idx, upper_idx]]
+                focus_range = focus_max - focus_min
+                
+                # Add padding
+                padding = focus_range * 0.1
+                self.ax.set_xlim(focus_min - padding, focus_max + padding)
+                
+            else:
+                # Show all data with padding
+                all_min_time = active_data_points.min()
+                all_max_time = active_data_points.max()
+                time_range = all_max_time - all_min_time
+                padding = max(time_range * 0.05, 1.0)  # At least 1 second padding
+                self.ax.set_xlim(all_min_time - padding, all_max_time + padding)
+
     def on_mouse_press(self, event):
         """Handle mouse press for box zoom"""
         if event.inaxes and not self.toolbar.mode:
@@ -782,18 +928,12 @@ class DentonGUI(tk.Tk):
                 # Calculate dynamic slider range based on file durations
                 current_file_duration = file_info.get('duration', 300.0)
                 
-                # Find the longest file duration
-                max_duration = 300.0  # Default fallback
-                for f_info, _, _ in self.current_file_data:
-                    if 'duration' in f_info and f_info['duration'] > max_duration:
-                        max_duration = f_info['duration']
-                
                 # Update slider range:
                 # Negative range = current file duration (to allow sliding back to start)
                 # Positive range = longest file duration (to allow aligning with end)
                 self.time_offset_slider.configure(
                     from_=-current_file_duration,
-                    to=max_duration
+                    to=self.max_duration
                 )
                 
                 # Update slider to show current offset for this file
@@ -801,6 +941,17 @@ class DentonGUI(tk.Tk):
                 self.time_offset_var.set(current_offset)
                 break
     
+    def on_slider_moved(self, value=None):
+        """Coalesce slider motion into at most one offset update per frame"""
+        if self.slider_job:
+            self.after_cancel(self.slider_job)
+        self.slider_job = self.after(16, self.apply_slider_offset)
+    
+    def apply_slider_offset(self):
+        """Apply the slider position once dragging has settled for a frame"""
+        self.slider_job = None
+        self.update_time_offset()
+    
     def update_time_offset(self, event=None):
         """Update the time offset for the selected file"""
         if not self.current_file_data or self.selected_file_index >= len(self.current_file_data):
@@ -812,9 +963,35 @@ class DentonGUI(tk.Tk):
         file_info = self.current_file_data[self.selected_file_index][0]
         self.file_offsets[file_info['original_path']] = offset_value
         
-        # Update the plot with new offsets
-        self.update_plot(self.current_file_data, self.current_column, 
-                        self.current_log_scale, apply_offset=True)
+        # Move the selected file's line to its new offset
+        self.apply_offset_fast(self.selected_file_index, offset_value)
+    
+    def apply_offset_fast(self, file_index, offset):
+        """Shift one plotted line in place instead of rebuilding the whole plot"""
+        if file_index not in self.plot_lines:
+            self.update_plot(self.current_file_data, self.current_column, 
+                            self.current_log_scale, apply_offset=True)
+            return
+        
+        self.move_line(file_index, offset)
+        self.redraw_offsets()
+    
+    def move_line(self, file_index, offset):
+        """Shift a plotted line to the given time offset and relabel it"""
+        line, plot_times, plot_buffer, label = self.plot_lines[file_index]
+        line.set_xdata(np.add(plot_times, offset, out=plot_buffer))
+        line.set_label(f"{label} [offset: {offset:.1f}s]" if offset != 0 else label)
+        
+        # Shift this file's share of the points used for the x-axis limits in place
+        times, span = self.time_spans[file_index]
+        np.add(times, offset, out=self.time_points[span])
+    
+    def redraw_offsets(self):
+        """Refresh the legend and x-axis limits after lines were moved, then redraw"""
+        self.update_legend()
+        self.set_time_limits()
+        self.original_xlim = self.ax.get_xlim()
+        self.canvas.draw_idle()
     
     def reset_time_offset(self):
         """Reset the time offset for the selected file"""
@@ -828,9 +1005,8 @@ class DentonGUI(tk.Tk):
         # Update slider
         self.time_offset_var.set(0.0)
         
-        # Update the plot
-        self.update_plot(self.current_file_data, self.current_column, 
-                        self.current_log_scale, apply_offset=True)
+        # Move the selected file's line back
+        self.apply_offset_fast(self.selected_file_index, 0.0)
     
     def reset_all_offsets(self):
         """Reset time offsets for all files"""
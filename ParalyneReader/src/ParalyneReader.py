@@ -1,49 +1,286 @@
 import requests
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses large file listings several times faster, but is optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Disable SSL warnings for self-signed certificates
 requests.packages.urllib3.disable_warnings()
 
 base_url = "https://nfhistory.nanofab.utah.edu/api/paralyne/analog"
 
+# Share one session so requests reuse pooled keep-alive connections instead of
+# repeating the TCP and TLS handshake for every call
+session = requests.Session()
+session.verify = False  # Server uses a self-signed certificate
+session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Remember what was downloaded so unchanged files aren't fetched again
+cache_file = ".paralyne_cache.json"
+cache_lock = threading.RLock()  # Parallel downloads share the cache file
+remote_files = {}  # Map from filename to its entry in the latest list_files() result
+
+# Reuse JSON responses: a conditional request lets the server answer 304 instead of
+# resending the body, and responses without validators are reused for list_ttl seconds
+list_ttl = 30
+response_cache = {}  # Map from URL to its parsed body, validators and fetch time
+
+# Files fetched ahead of time by prefetch_file(), held in memory until download_file()
+# asks for them so nothing is written to disk that the user didn't request
+max_prefetched = 16
+prefetched_files = {}  # Map from filename to its content and the metadata it was fetched with
+prefetch_lock = threading.Lock()
+
+
+def _load_cache():
+    """Load the download cache, mapping filename to the metadata it was downloaded with."""
+    with cache_lock:
+        try:
+            with open(os.path.abspath(cache_file), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def _save_cache_entry(filename, entry):
+    """Record the metadata a file was downloaded with."""
+    with cache_lock:
+        cache = _load_cache()
+        cache[filename] = entry
+        # Write a temporary file and rename it over the cache, so an interrupted
+        # write never leaves half a JSON document behind
+        tmp_path = os.path.abspath(cache_file) + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, os.path.abspath(cache_file))
+
+
+def _is_up_to_date(filename, entry):
+    """Check whether the local copy recorded by a cache entry matches what the server last listed."""
+    file_path = os.path.abspath(filename)
+    remote = remote_files.get(filename)
+    return bool(entry and remote and os.path.exists(file_path)
+                and os.path.getsize(file_path) == remote['size'] == entry.get('size')
+                and remote['modified'] == entry.get('modified'))
+
+
+def _range_start(response):
+    """Return the first byte offset of a 206 response's Content-Range, or None if it can't be read."""
+    # The header looks like "bytes 500-999/1234"
+    unit, _, spec = response.headers.get('Content-Range', '').partition(' ')
+    try:
+        return int(spec.split('-', 1)[0]) if unit == 'bytes' else None
+    except ValueError:
+        return None
+
+
+def _parse_json(response):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _get_json(url, params=None):
+    """
+    GET a JSON endpoint through the response cache, which is keyed by URL alone.
+    Returns (status_code, body, response); body is the cached copy when the server answers 304.
+    """
+    cached = response_cache.get(url)
+    # Without an ETag or Last-Modified the server can't answer 304, so fall back to a short TTL
+    if cached and not cached['etag'] and not cached['last_modified'] \
+            and time.monotonic() - cached['fetched'] < list_ttl:
+        return 200, cached['data'], None
+    
+    headers = {}
+    if cached and cached['etag']:
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached['last_modified']:
+        headers['If-Modified-Since'] = cached['last_modified']
+    
+    response = session.get(url, params=params, headers=headers)
+    if response.status_code == 304 and cached:
+        cached['fetched'] = time.monotonic()
+        return 200, cached['data'], response
+    if response.status_code != 200:
+        return response.status_code, None, response
+    
+    data = _parse_json(response)
+    response_cache[url] = {
+        'data': data,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'fetched': time.monotonic(),
+    }
+    return 200, data, response
+
 
 def list_files():
     """List all files in the Paralyne analog data directory."""
-    response = requests.get(f"{base_url}/list", verify=False)
-    if response.status_code == 200:
-        resp = response.json()
+    # Ask only for the fields the file list shows, so the server can skip the rest
+    status_code, resp, response = _get_json(f"{base_url}/list", params={'fields': 'filename,size,modified'})
+    if status_code == 200:
         print("Available files:")
         for file_info in resp['files']:
             print(f"- {file_info['filename']} (Size: {file_info['size']} bytes, Modified: {file_info['modified']})")
+            remote_files[file_info['filename']] = file_info
         return resp['files']
     else:
-        raise Exception(f"Error fetching file list: {response.status_code} - {response.text}")
+        raise Exception(f"Error fetching file list: {status_code} - {response.text}")
     
 def download_file(filename):
     """Download a specific file from the Paralyne analog data directory."""
-    response = requests.get(f"{base_url}/download/{filename}", verify=False)
-    if response.status_code == 200:
-        # Get the absolute path where the file will be saved
-        file_path = os.path.abspath(filename)
-        
-        with open(file_path, 'wb') as file:
-            file.write(response.content)
+    # Get the absolute path where the file will be saved
+    file_path = os.path.abspath(filename)
+    part_path = file_path + '.part'
+    entry = _load_cache().get(filename, {})
+    
+    # Skip the download if the local copy matches what the server last listed
+    cached = entry if entry and os.path.exists(file_path) else None
+    remote = remote_files.get(filename)
+    if _is_up_to_date(filename, cached):
+        print(f"File '{filename}' is already up to date.")
+        return file_path
+    
+    # Use a prefetched copy if it is still the version the server lists
+    with prefetch_lock:
+        early = prefetched_files.pop(filename, None)
+    if early and early['modified'] == (remote['modified'] if remote else None):
+        with open(part_path, 'wb') as file:
+            file.write(early['content'])
+        os.replace(part_path, file_path)
         print(f"File '{filename}' downloaded successfully.")
         
-        # Return the full path to the downloaded file
+        _save_cache_entry(filename, {
+            'size': os.path.getsize(file_path),
+            'modified': early['modified'],
+            'etag': early['etag'],
+            'last_modified': early['last_modified'],
+        })
         return file_path
-    else:
-        raise Exception(f"Error downloading file '{filename}': {response.status_code} - {response.text}")
+    
+    # Otherwise let the server say whether the local copy is still current
+    headers = {}
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+    
+    # Pick up an interrupted download where it stopped, as long as the server
+    # still has the same version of the file; otherwise it sends all of it
+    resume_from = os.path.getsize(part_path) if entry.get('partial') and os.path.exists(part_path) else 0
+    if resume_from:
+        headers['Range'] = f"bytes={resume_from}-"
+        headers['If-Range'] = entry['partial']
+    
+    # Stream the body to disk in chunks rather than holding the whole file in memory
+    with session.get(f"{base_url}/download/{filename}", headers=headers, stream=True) as response:
+        if response.status_code == 304:
+            if remote:
+                # Note the listed timestamp so the next call can skip the request
+                _save_cache_entry(filename, dict(cached, modified=remote['modified']))
+            print(f"File '{filename}' is already up to date.")
+            return file_path
+        elif response.status_code == 206 and _range_start(response) != resume_from:
+            # The server sent a different range than asked for, so appending it would
+            # corrupt the file; fall through and restart without a Range header
+            if not resume_from:
+                raise Exception(f"Error downloading file '{filename}': unexpected range "
+                                f"{response.headers.get('Content-Range')}")
+        elif response.status_code in (200, 206):
+            if response.status_code == 200:
+                # Remember which version the .part file holds so it can be resumed;
+                # If-Range only accepts a strong ETag or a Last-Modified date
+                etag = response.headers.get('ETag')
+                validator = etag if etag and not etag.startswith('W/') else response.headers.get('Last-Modified')
+                _save_cache_entry(filename, dict(entry, partial=validator))
+            
+            # Write beside the target and rename once complete, so an interrupted
+            # download never leaves a truncated file that looks finished
+            with open(part_path, 'ab' if response.status_code == 206 else 'wb') as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+            os.replace(part_path, file_path)
+            print(f"File '{filename}' downloaded successfully.")
+            
+            _save_cache_entry(filename, {
+                'size': os.path.getsize(file_path),
+                'modified': remote['modified'] if remote else None,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            })
+            
+            # Return the full path to the downloaded file
+            return file_path
+        elif response.status_code != 416 or not resume_from:
+            raise Exception(f"Error downloading file '{filename}': {response.status_code} - {response.text}")
+    
+    # The server rejected the range (the .part file may already hold every byte) or
+    # answered with the wrong one; start over rather than guess what is on disk
+    os.remove(part_path)
+    _save_cache_entry(filename, dict(entry, partial=None))
+    return download_file(filename)
+
+
+def prefetch_file(filename):
+    """Fetch a small file into memory so a later download_file() call needs no transfer."""
+    remote = remote_files.get(filename)
+    modified = remote['modified'] if remote else None
+    # Nothing to fetch if the file is already on disk or in memory at this version
+    if _is_up_to_date(filename, _load_cache().get(filename)):
+        return
+    with prefetch_lock:
+        early = prefetched_files.get(filename)
+        if early and early['modified'] == modified:
+            return
+    
+    response = session.get(f"{base_url}/download/{filename}")
+    if response.status_code != 200:
+        raise Exception(f"Error prefetching file '{filename}': {response.status_code} - {response.text}")
+    
+    with prefetch_lock:
+        prefetched_files[filename] = {
+            'content': response.content,
+            'modified': modified,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        # Drop the oldest prefetches once the limit is reached
+        while len(prefetched_files) > max_prefetched:
+            del prefetched_files[next(iter(prefetched_files))]
+
+
+def download_files(filenames, max_workers=4, on_ready=None):
+    """
+    Download several files in parallel, returning their full paths in the same order.
+    If given, on_ready(filename, path) is called from the worker thread as soon as
+    each file is written, so callers can use it without waiting for the whole batch.
+    """
+    def fetch(filename):
+        path = download_file(filename)
+        if on_ready is not None:
+            on_ready(filename, path)
+        return path
+    
+    # Downloads are network bound, so threads overlap them despite the GIL
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(fetch, filenames))
     
 
 def return_selected(filename):
     """Return the selected file information."""
-    response = requests.get(f"{base_url}/return/{filename}", verify=False)
-    if response.status_code == 200:
-        return response.json()
+    status_code, resp, response = _get_json(f"{base_url}/return/{filename}")
+    if status_code == 200:
+        return resp
     else:
-        raise Exception(f"Error fetching file info for '{filename}': {response.status_code} - {response.text}")
+        raise Exception(f"Error fetching file info for '{filename}': {status_code} - {response.text}")
     
 ###
 # 
@@ -5,6 +5,8 @@ import os
 import sys
 from tkinter import messagebox
 import csv
+import io
+import operator
 import threading
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
@@ -12,11 +14,11 @@ import random
 import colorsys
 import numpy as np
 from scipy import stats
-from scipy.signal import savgol_filter, medfilt
-from scipy.ndimage import gaussian_filter1d
-from ParalyneReader import list_files, download_file, return_selected
+from scipy.signal import savgol_filter, oaconvolve
+from scipy.ndimage import median_filter
+from ParalyneReader import list_files, prefetch_file, download_files, return_selected
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 import queue
 import time
 
@@ -30,6 +32,7 @@ class ParalyneReaderApp:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)        # Store downloaded files for graphing
         self.downloaded_files = []
+        self.downloaded_filenames = set()  # Names in downloaded_files, for fast lookups
         self.columns = []
         
         # Generate distinct colors for plots
@@ -49,13 +52,19 @@ class ParalyneReaderApp:
         # Performance optimization: Add data caching and threading
         self.raw_data_cache = {}  # Cache raw file data
         self.processed_data_cache = {}  # Cache processed data
+        self.gaussian_kernel_cache = {}  # Map from sigma to its normalized kernel
         self.loading_threads = {}  # Track active loading threads
         self.thread_pool = ThreadPoolExecutor(max_workers=4)
         self.load_queue = queue.Queue()
         
         # Performance settings
         self.max_plot_points = 2000  # Downsample for plotting
-        self.chunk_size = 10000  # Process files in chunks
+        
+        # Fetch the newest small files into memory in the background after listing,
+        # so they are usually ready by the time the user clicks Download
+        self.prefetch_count = 5
+        self.prefetch_max_bytes = 1024 * 1024
+        self.prefetch_futures = {}  # Map from filename to its pending prefetch
 
         # Create main frame
         main_frame = ttk.Frame(root, padding="10")
@@ -81,8 +90,8 @@ class ParalyneReaderApp:
         self.status_label = ttk.Label(main_frame, text="Ready", foreground="green")
         self.status_label.grid(row=2, column=0, pady=(10, 0), sticky="w")
 
-        # Load initial file list
-        self.refresh_file_list()
+        # Load initial file list once the mainloop is running to receive the result
+        self.root.after(0, self.refresh_file_list)
 
     def generate_distinct_colors(self, n):
         """Generate n visually distinct colors"""
@@ -364,40 +373,42 @@ class ParalyneReaderApp:
         self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
 
     def refresh_file_list(self):
-        """Refresh the file list by calling list_files()"""
+        """Refresh the file list by calling list_files() on a worker thread"""
+        self.status_label.config(text="Loading file list...", foreground="blue")
+        
+        # Keep the mainloop responsive while the request is in flight
+        future = self.thread_pool.submit(list_files)
+        future.add_done_callback(lambda f: self.root.after(0, self.populate_file_list, f))
+
+    def populate_file_list(self, future):
+        """Fill the file list from a finished list_files() call"""
         try:
-            self.status_label.config(text="Loading file list...", foreground="blue")
-            self.root.update()
+            # Get files from ParalyneReader
+            files = future.result()
             
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            # Clear existing items in one call
+            self.tree.delete(*self.tree.get_children())
             
-            # Get files from ParalyneReader
-            files = list_files()
+            # The server sends one record layout, so check the first entry instead of each one
+            if files and isinstance(files[0], dict):
+                entries = [(f.get('filename', 'Unknown'), f.get('size', 0), f.get('modified', '')) for f in files]
+            else:
+                entries = [self.parse_file_entry(f) for f in files]
             
             # Populate treeview
-            for file_info in files:
-                if isinstance(file_info, dict):
-                    filename = file_info.get('filename', 'Unknown')
-                    size = self.format_file_size(file_info.get('size', 0))
-                    modified = self.format_date(file_info.get('modified', ''))
-                elif isinstance(file_info, (list, tuple)) and len(file_info) >= 3:
-                    filename = file_info[0]
-                    size = self.format_file_size(file_info[1])
-                    modified = self.format_date(file_info[2])
-                else:
-                    filename = str(file_info)
-                    size = "Unknown"
-                    modified = "Unknown"
+            downloaded = self.downloaded_filenames
+            format_file_size, format_date = self.format_file_size, self.format_date
+            for filename, size, modified in entries:
+                values = (filename, format_file_size(size), format_date(modified))
                 
-                # Insert item and check if already downloaded
-                item_id = self.tree.insert("", "end", values=(filename, size, modified))
-                
-                # Mark already downloaded files with different tag
-                if self.is_file_already_downloaded(filename):
-                    self.tree.set(item_id, "filename", f"{filename} (Downloaded)")
-                    self.tree.item(item_id, tags=("downloaded",))
+                # Insert the item, marking already downloaded files with a different tag
+                if filename in downloaded:
+                    self.tree.insert("", "end", values=(f"{filename} (Downloaded)",) + values[1:],
+                                     tags=("downloaded",))
+                else:
+                    self.tree.insert("", "end", values=values)
+            
+            self.prefetch_recent_files(files)
             
             self.status_label.config(text=f"Loaded {len(files)} files", foreground="green")
             
@@ -406,82 +417,146 @@ class ParalyneReaderApp:
             self.status_label.config(text=error_msg, foreground="red")
             messagebox.showerror("Error", error_msg)
 
+    def parse_file_entry(self, file_info):
+        """Return (filename, size, modified) for one list_files() entry of any layout"""
+        if isinstance(file_info, dict):
+            return file_info.get('filename', 'Unknown'), file_info.get('size', 0), file_info.get('modified', '')
+        elif isinstance(file_info, (list, tuple)) and len(file_info) >= 3:
+            return file_info[0], file_info[1], file_info[2]
+        else:
+            return str(file_info), "Unknown", "Unknown"
+
+    def prefetch_recent_files(self, files):
+        """Start background prefetches of the most recently modified small files"""
+        candidates = [f for f in files
+                      if isinstance(f, dict) and f.get('size', 0) < self.prefetch_max_bytes
+                      and not self.is_file_already_downloaded(f.get('filename'))
+                      and not self.is_prefetch_pending(f.get('filename'))]
+        candidates.sort(key=lambda f: str(f.get('modified', '')), reverse=True)
+        
+        for f in candidates[:self.prefetch_count]:
+            # The content stays in memory; download_file only writes it out when asked
+            self.prefetch_futures[f['filename']] = self.thread_pool.submit(prefetch_file, f['filename'])
+
+    def is_prefetch_pending(self, filename):
+        """Check if a prefetch of the given file is still running"""
+        future = self.prefetch_futures.get(filename)
+        return future is not None and not future.done()
+
     def is_file_already_downloaded(self, filename):
         """Check if a file with the given name is already in the downloaded files list"""
-        return any(file_info['filename'] == filename for file_info in self.downloaded_files)
+        return filename in self.downloaded_filenames
 
     def download_selected_file(self):
-        """Download the selected file"""
+        """Download the selected files"""
         selection = self.tree.selection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a file to download.")
             return
         
-        item = self.tree.item(selection[0])
-        filename = item['values'][0]
-        
-        # Remove " (Downloaded)" suffix if present for the actual filename
-        if filename.endswith(" (Downloaded)"):
-            actual_filename = filename.replace(" (Downloaded)", "")
-        else:
-            actual_filename = filename
+        filenames = []
+        already_downloaded = []
+        for selected in selection:
+            item = self.tree.item(selected)
+            filename = item['values'][0]
+            
+            # Remove " (Downloaded)" suffix if present for the actual filename
+            if filename.endswith(" (Downloaded)"):
+                actual_filename = filename.replace(" (Downloaded)", "")
+            else:
+                actual_filename = filename
+            
+            # Check if file is already downloaded
+            if self.is_file_already_downloaded(actual_filename):
+                already_downloaded.append(actual_filename)
+            else:
+                filenames.append(actual_filename)
         
-        # Check if file is already downloaded
-        if self.is_file_already_downloaded(actual_filename):
+        if already_downloaded:
             messagebox.showwarning("File Already Downloaded", 
-                                 f"The file '{actual_filename}' has already been downloaded.\n"
-                                 f"Remove it from the downloaded files list if you want to download it again.")
+                                 f"The file(s) {', '.join(repr(f) for f in already_downloaded)} have already been downloaded.\n"
+                                 f"Remove them from the downloaded files list if you want to download them again.")
+        if not filenames:
             return
         
+        description = filenames[0] if len(filenames) == 1 else f"{len(filenames)} files"
+        self.status_label.config(text=f"Downloading {description}...", foreground="blue")
+        
+        # Let any prefetch of these files finish so the download can use it
+        pending = [self.prefetch_futures.pop(name) for name in filenames if name in self.prefetch_futures]
+        
+        def on_ready(filename, path):
+            # Show each file as soon as it lands instead of after the whole batch
+            self.root.after(0, self.add_downloaded_file, filename, path)
+        
+        def download_worker():
+            wait(pending)
+            # Fetch all selected files in parallel over the shared session
+            return download_files(filenames, on_ready=on_ready)
+        
+        future = self.thread_pool.submit(download_worker)
+        future.add_done_callback(lambda f: self.root.after(0, self.finish_download, f, description))
+
+    def add_downloaded_file(self, filename, path):
+        """Add a freshly downloaded file to the downloaded files list"""
+        file_info = {
+            'filename': filename,
+            'path': path,
+            'columns': [],
+            'tree_id': None,
+            'is_csv': os.path.splitext(filename)[1].lower() == '.csv'
+        }
+        
+        # Add to downloaded files treeview FIRST
+        status = "Loading..." if file_info['is_csv'] else "Unknown format"
+        tree_id = self.downloaded_tree.insert('', tk.END, 
+                                         values=(filename, status, 0))
+        file_info['tree_id'] = tree_id
+        
+        # Load columns if it's a CSV file AFTER setting tree_id
+        if file_info['is_csv']:
+            self.load_csv_columns(file_info)
+        
+        self.downloaded_files.append(file_info)
+        self.downloaded_filenames.add(filename)
+        self.update_common_columns()
+        
+        self.status_label.config(text=f"Downloaded {filename}", foreground="green")
+
+    def finish_download(self, future, description):
+        """Report the outcome of a batch download once every file is done"""
         try:
-            self.status_label.config(text=f"Downloading {actual_filename}...", foreground="blue")
-            self.root.update()
-            
-            # Call download_file function
-            downloaded_path = download_file(actual_filename)
-            
-            # Add to downloaded files list
-            file_info = {
-                'filename': actual_filename,
-                'path': downloaded_path,
-                'columns': [],
-                'tree_id': None
-            }
-            
-            # Add to downloaded files treeview FIRST
-            status = "Loading..." if actual_filename.lower().endswith('.csv') else "Unknown format"
-            tree_id = self.downloaded_tree.insert('', tk.END, 
-                                             values=(actual_filename, status, 0))
-            file_info['tree_id'] = tree_id
-            
-            # Load columns if it's a CSV file AFTER setting tree_id
-            if actual_filename.lower().endswith('.csv'):
-                self.load_csv_columns(file_info)
-            
-            self.downloaded_files.append(file_info)
-            self.update_common_columns()
+            future.result()
             
             # Refresh the file list to show the downloaded status
             self.refresh_file_list()
             
-            self.status_label.config(text=f"Successfully downloaded {actual_filename}", foreground="green")
-            messagebox.showinfo("Download Complete", f"File '{actual_filename}' has been downloaded successfully.")
+            self.status_label.config(text=f"Successfully downloaded {description}", foreground="green")
+            messagebox.showinfo("Download Complete", f"Downloaded {description} successfully.")
             
         except Exception as e:
-            error_msg = f"Failed to download {actual_filename}: {str(e)}"
+            error_msg = f"Failed to download {description}: {str(e)}"
             self.status_label.config(text=error_msg, foreground="red")
             messagebox.showerror("Download Error", error_msg)
 
     def load_csv_columns(self, file_info):
         """Load column names from a CSV file"""
         try:
-            with open(file_info['path'], 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                # Get the first row as header
-                header = next(reader, None)
+            # Only the first line is needed, so read it directly instead of setting up a reader
+            with open(file_info['path'], 'rb') as csvfile:
+                line = csvfile.readline().decode('utf-8').rstrip('\r\n')
+                
+                # Split on commas unless the header has quoted fields
+                if not line:
+                    header = None
+                elif '"' in line:
+                    header = tuple(next(csv.reader([line])))
+                else:
+                    header = tuple(line.split(','))
                 
                 if header:
                     file_info['columns'] = header
+                    file_info['columns_set'] = frozenset(header)
                     # Update status in treeview
                     self.downloaded_tree.item(file_info['tree_id'], 
                                              values=(file_info['filename'], "Ready", len(header)))
@@ -512,12 +587,9 @@ class ParalyneReaderApp:
             self.column_var.set("")
             return
         
-        # Initialize with columns from the first file with columns
-        common_columns = set(files_with_columns[0]['columns'])
-        
-        # Find intersection of all column sets
-        for file_info in files_with_columns[1:]:
-            common_columns.intersection_update(file_info['columns'])
+        # Intersect every file's column set in one call
+        common_columns = files_with_columns[0]['columns_set'].intersection(
+            *(file_info['columns_set'] for file_info in files_with_columns[1:]))
         
         self.columns = sorted(list(common_columns))
         
@@ -558,6 +630,7 @@ class ParalyneReaderApp:
             file_info = next((f for f in self.downloaded_files if f['tree_id'] == item), None)
             if file_info:
                 self.downloaded_files.remove(file_info)
+                self.downloaded_filenames.discard(file_info['filename'])
                 # Remove the file from disk if it exists
                 try:
                     if os.path.exists(file_info['path']):
@@ -591,6 +664,7 @@ class ParalyneReaderApp:
         
         # Clear the list and treeview
         self.downloaded_files.clear()
+        self.downloaded_filenames.clear()
         self.downloaded_tree.delete(*self.downloaded_tree.get_children())
         
         # Update columns and clear graph
@@ -603,11 +677,12 @@ class ParalyneReaderApp:
         self.canvas.draw()
 
     def apply_smoothing(self, values, method, window_size):
-        """Apply smoothing to data values with adaptive window sizing"""
+        """Apply smoothing to data values with adaptive window sizing; smoothed results are NumPy arrays"""
         if method == "none" or len(values) < 3:
             return values
         
-        values_array = np.array(values)
+        # Single precision is plenty for sensor readings and halves the memory traffic
+        values_array = np.asarray(values, dtype=np.float32)
         
         # For moving average, use adaptive window size
         if method == "moving_average":
@@ -636,10 +711,11 @@ class ParalyneReaderApp:
                 pad_width = window // 2
                 padded = np.pad(values_array, pad_width, mode='edge')
                 
-                # Apply convolution
-                kernel = np.ones(window) / window
-                smoothed = np.convolve(padded, kernel, mode='valid')
-                return smoothed.tolist()
+                # Each window sum is a difference of running sums, so the cost
+                # doesn't grow with the window size like a convolution does
+                cumsum = np.concatenate(([0.0], np.cumsum(padded, dtype=np.float64)))
+                smoothed = ((cumsum[window:] - cumsum[:-window]) / window).astype(np.float32)
+                return smoothed
                 
             elif method == "savgol":
                 # Savitzky-Golay filter
@@ -651,13 +727,22 @@ class ParalyneReaderApp:
                 
                 poly_order = min(3, window - 1)
                 smoothed = savgol_filter(values_array, window, poly_order)
-                return smoothed.tolist()
+                return smoothed
                 
             elif method == "gaussian":
                 # Gaussian filter
                 sigma = adaptive_window / 6.0  # Convert window size to sigma
-                smoothed = gaussian_filter1d(values_array, sigma)
-                return smoothed.tolist()
+                # Same result as gaussian_filter1d (reflected edges), but the
+                # kernel is only built once per window size
+                kernel = self.get_gaussian_kernel(sigma)
+                radius = len(kernel) // 2
+                padded = np.pad(values_array, radius, mode='symmetric')
+                if len(kernel) > 256:
+                    # Overlap-add FFT convolution is much faster for wide kernels
+                    smoothed = oaconvolve(padded, kernel, mode='valid')
+                else:
+                    smoothed = np.convolve(padded, kernel, mode='valid')
+                return smoothed
                 
             elif method == "median":
                 # Median filter
@@ -665,8 +750,10 @@ class ParalyneReaderApp:
                 if window % 2 == 0:
                     window += 1  # Ensure odd window size
                 
-                smoothed = medfilt(values_array, kernel_size=window)
-                return smoothed.tolist()
+                # Repeat the end values at the edges rather than padding with
+                # zeros, which would drag the first and last samples toward 0
+                smoothed = median_filter(values_array, size=window, mode='nearest')
+                return smoothed
                 
         except Exception as e:
             logging.warning(f"Error applying smoothing method {method}: {str(e)}")
@@ -674,12 +761,23 @@ class ParalyneReaderApp:
         
         return values
 
+    def get_gaussian_kernel(self, sigma):
+        """Return the normalized Gaussian kernel gaussian_filter1d would use for sigma"""
+        kernel = self.gaussian_kernel_cache.get(sigma)
+        if kernel is None:
+            radius = int(4.0 * sigma + 0.5)  # gaussian_filter1d's default truncate of 4 sigma
+            x = np.arange(-radius, radius + 1)
+            kernel = np.exp(-0.5 * (x / sigma) ** 2)
+            kernel = (kernel / kernel.sum()).astype(np.float32)
+            self.gaussian_kernel_cache[sigma] = kernel
+        return kernel
+
     def apply_normalization(self, values, method):
-        """Apply normalization to data values"""
+        """Apply normalization to data values; normalized results are NumPy arrays"""
         if method == "none" or len(values) == 0:
             return values
         
-        values_array = np.array(values)
+        values_array = np.asarray(values)
         
         try:
             if method == "minmax":
@@ -690,7 +788,7 @@ class ParalyneReaderApp:
                     normalized = (values_array - min_val) / (max_val - min_val)
                 else:
                     normalized = np.zeros_like(values_array)
-                return normalized.tolist()
+                return normalized
                 
             elif method == "zscore":
                 # Z-score normalization (mean=0, std=1)
@@ -700,18 +798,17 @@ class ParalyneReaderApp:
                     normalized = (values_array - mean_val) / std_val
                 else:
                     normalized = np.zeros_like(values_array)
-                return normalized.tolist()
+                return normalized
                 
             elif method == "robust":
                 # Robust normalization using median and IQR
-                median_val = np.median(values_array)
-                q75, q25 = np.percentile(values_array, [75, 25])
+                q25, median_val, q75 = np.percentile(values_array, [25, 50, 75])
                 iqr = q75 - q25
                 if iqr != 0:
                     normalized = (values_array - median_val) / iqr
                 else:
                     normalized = np.zeros_like(values_array)
-                return normalized.tolist()
+                return normalized
                 
         except Exception as e:
             logging.warning(f"Error applying normalization method {method}: {str(e)}")
@@ -769,7 +866,7 @@ class ParalyneReaderApp:
             self.show_progress("Loading files...")
         
         self.status_label.config(text=f"Generating graphs for {column}...", foreground="blue")
-        self.root.update()
+        self.root.update_idletasks()
         
         # Store current settings
         self.current_column = column
@@ -789,7 +886,7 @@ class ParalyneReaderApp:
             try:
                 # Load raw data (without time offset)
                 raw_times, values = self.load_file_data(file_info, column)
-                if raw_times and values:
+                if len(raw_times) and len(values):
                     # Store raw times and values so we can re-apply offsets later
                     file_data.append((file_info, raw_times, values))
             except Exception as e:
@@ -811,7 +908,7 @@ class ParalyneReaderApp:
                     ))
                       # Load raw data (without time offset)
                     raw_times, values = self.load_file_data(file_info, column)
-                    if raw_times and values:
+                    if len(raw_times) and len(values):
                         # Store raw times and values so we can re-apply offsets later
                         file_data.append((file_info, raw_times, values))
                 except Exception as e:
@@ -856,12 +953,8 @@ class ParalyneReaderApp:
         values = []
         
         try:
-            file_size = os.path.getsize(file_info['path'])
-            is_large_file = file_size > 1024 * 1024  # 1MB threshold
-            
             with open(file_info['path'], 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                header = next(reader, None)
+                header = next(csv.reader([csvfile.readline()]), None)
                 
                 if not header or column not in header:
                     return times, values
@@ -875,68 +968,40 @@ class ParalyneReaderApp:
                         time_column_index = i
                         break
                 
-                if is_large_file:
-                    # Process large files in chunks
-                    chunk = []
-                    total_rows = 0
-                    processed_rows = 0
-                    
-                    # Count total rows for progress
-                    csvfile.seek(0)
-                    next(csv.reader(csvfile))  # Skip header
-                    total_rows = sum(1 for _ in csv.reader(csvfile))
-                    csvfile.seek(0)
-                    next(csv.reader(csvfile))  # Skip header again
-                    
-                    reader = csv.reader(csvfile)
-                    
-                    for row in reader:
-                        chunk.append(row)
-                        processed_rows += 1
-                        
-                        if len(chunk) >= self.chunk_size:
-                            chunk_times, chunk_values = self.process_chunk(
-                                chunk, header, column, time_column_index, column_index, file_info, apply_offset=False
-                            )
-                            times.extend(chunk_times)
-                            values.extend(chunk_values)
-                            chunk = []
-                            
-                            # Update progress
-                            progress = (processed_rows / total_rows) * 100
-                            self.root.after(0, lambda p=progress: self.update_progress(
-                                p, f"Processing {file_info['filename']}: {processed_rows}/{total_rows} rows"
-                            ))
-                        
-                        # Allow GUI to update
-                        if processed_rows % 1000 == 0:
-                            self.root.update()
-                    
-                    # Process remaining rows
-                    if chunk:
-                        chunk_times, chunk_values = self.process_chunk(
-                            chunk, header, column, time_column_index, column_index, file_info, apply_offset=False
-                        )
-                        times.extend(chunk_times)
-                        values.extend(chunk_values)
-                else:
-                    # Process smaller files normally
-                    for row in reader:
-                        if len(row) > max(column_index, time_column_index):                        
-                            try:
-                                # Parse time from the determined time column
-                                if len(row[time_column_index]) > 0:
-                                    time_val = self.parse_time(row[time_column_index])
-                                    value = float(row[column_index])
-                                    
-                                    # Convert pico value to machine value
-                                    converted_value = self.convert_pico_to_machine_value(value)
-                                    
-                                    # DO NOT apply time offset here - store raw times
-                                    times.append(time_val)
-                                    values.append(converted_value)
-                            except (ValueError, TypeError):
-                                continue
+                # Split the rest of the file in one go; the csv module is only
+                # needed when fields are quoted
+                text = csvfile.read()
+            
+            if '"' in text:
+                rows = csv.reader(io.StringIO(text))
+            else:
+                # Split on \n and drop a trailing \r, as csv.reader does; splitlines()
+                # would also break rows at characters like \x0c or \u2028
+                lines = (line[:-1] if line.endswith('\r') else line for line in text.split('\n'))
+                rows = (line.split(',') for line in lines if line)
+            get_columns = operator.itemgetter(time_column_index, column_index)
+            pairs = [get_columns(row) for row in rows if len(row) > max(column_index, time_column_index)]
+            if not pairs:
+                return times, values
+            
+            time_strs, value_strs = (np.array(col, dtype=str) for col in zip(*pairs))
+            
+            # Convert whole columns at once, dropping rows with no time or a bad value
+            keep = time_strs != ''
+            raw_values = np.zeros(len(value_strs))
+            try:
+                raw_values[keep] = value_strs[keep].astype(np.float64)
+            except ValueError:
+                for i in np.flatnonzero(keep).tolist():
+                    try:
+                        raw_values[i] = float(value_strs[i])
+                    except ValueError:
+                        keep[i] = False
+            
+            # Convert pico value to machine value
+            values = self.convert_pico_to_machine_value(raw_values[keep]).astype(np.float32)
+            # DO NOT apply time offset here - store raw times
+            times = self.parse_times(time_strs[keep])
             
             # Cache the loaded data (WITHOUT time offset applied)
             self.raw_data_cache[cache_key] = (times, values)
@@ -951,6 +1016,24 @@ class ParalyneReaderApp:
         # Rearranging: b = (a - 1202.88) / 174.96
         return (pico_value - 1202.88) / 174.96
     
+    def parse_times(self, time_strs):
+        """Parse an array of time strings, giving the same results as parse_time on each"""
+        if len(time_strs) == 0:
+            return []
+        
+        # Columns in a single layout numpy can parse are converted in bulk;
+        # anything else falls back to one parse_time call per string
+        first = self.parse_time(time_strs[0])
+        try:
+            if isinstance(first, float):
+                return (time_strs.astype(np.float64) / 60000.0).tolist()
+            if isinstance(first, datetime) and (np.char.str_len(time_strs) == 19).all() \
+                    and first == datetime.strptime(time_strs[0], "%Y-%m-%d %H:%M:%S"):
+                return time_strs.astype('datetime64[s]').astype(object).tolist()
+        except ValueError:
+            pass
+        return [self.parse_time(time_str) for time_str in time_strs.tolist()]
+
     def parse_time(self, time_str):
         """Parse time string into datetime or float"""
         # Try common datetime formats first
@@ -991,7 +1074,7 @@ class ParalyneReaderApp:
             markers = ['o', 's', '^', 'D', 'v', '*', 'p', 'h', '+', 'x']
             
             for i, (file_info, raw_times, values) in enumerate(file_data):
-                if not raw_times or not values:
+                if len(raw_times) == 0 or len(values) == 0:
                     continue
                 
                 # Apply time offset to raw times
@@ -1024,8 +1107,9 @@ class ParalyneReaderApp:
                 
                 # Plot with style variations - use markers only for small datasets
                 if len(plot_values) > 500:  # Don't use markers for large datasets
+                    # Rasterize dense lines so figures saved as PDF/SVG stay small and quick to open
                     self.ax.plot(plot_times, plot_values, color=color, linestyle=style, 
-                               label=label, linewidth=1.5)
+                               label=label, linewidth=1.5, rasterized=True)
                 else:
                     self.ax.plot(plot_times, plot_values, color=color, linestyle=style, 
                                marker=marker, markersize=3, label=label, 
@@ -1200,12 +1284,10 @@ class ParalyneReaderApp:
             return "0 B"
         
         size_names = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        i = min((abs(size_bytes).bit_length() - 1) // 10, len(size_names) - 1)
         
-        return f"{size_bytes:.1f} {size_names[i]}"
+        return f"{size_bytes / 1024 ** i:.1f} {size_names[i]}"
 
     def format_date(self, date_input):
         """Format date in readable format"""
@@ -1231,66 +1313,50 @@ class ParalyneReaderApp:
         self.progress_bar.pack(fill=tk.X, padx=10, pady=5)
         self.progress_label.pack(pady=2)
         self.progress_frame.pack(fill=tk.X, pady=5)
-        self.root.update()
+        self.root.update_idletasks()
 
     def update_progress(self, value, message=""):
         """Update progress bar value and message"""
         self.progress_var.set(value)
         if message:
             self.progress_label.config(text=message)
-        self.root.update()
+        self.root.update_idletasks()
 
     def hide_progress(self):
         """Hide progress bar"""
         self.progress_frame.pack_forget()
-        self.root.update()
+        self.root.update_idletasks()
 
     def get_cache_key(self, file_info, column):
         """Generate cache key for file data"""
         return f"{file_info['filename']}_{column}_{file_info.get('size', 0)}"
 
     def downsample_data(self, times, values, max_points=None):
-        """Downsample data for efficient plotting"""
+        """Downsample data for efficient plotting, keeping the first, min, max and last point of each bin"""
         if max_points is None:
-            max_points = self.max_plot_points
+            # Four points per pixel column draw the same line as the full series
+            width_pixels = int(self.figure.get_size_inches()[0] * self.figure.dpi)
+            max_points = max(self.max_plot_points, 4 * width_pixels)
             
-        if len(values) <= max_points:
+        n = len(values)
+        if n <= max_points:
             return times, values
         
-        # Use every nth point for downsampling
-        step = max(1, len(values) // max_points)
-        return times[::step], values[::step]
-
-    def process_chunk(self, chunk, header, column, time_column_index, column_index, file_info, apply_offset=True):
-        """Process a chunk of CSV rows"""
-        times = []
-        values = []
-        
-        for row in chunk:
-            if len(row) > max(column_index, time_column_index):
-                try:
-                    # Parse time from the determined time column
-                    if len(row[time_column_index]) > 0:
-                        time_val = self.parse_time(row[time_column_index])
-                        value = float(row[column_index])
-                        
-                        # Convert pico value to machine value
-                        converted_value = self.convert_pico_to_machine_value(value)
-                        
-                        # Apply time offset only if requested
-                        if apply_offset:
-                            offset = self.file_offsets.get(file_info['filename'], 0.0)
-                            if isinstance(time_val, datetime):
-                                time_val = time_val + timedelta(seconds=offset)
-                            else:
-                                time_val += offset
-                        
-                        times.append(time_val)
-                        values.append(converted_value)
-                except (ValueError, TypeError):
-                    continue
-        
-        return times, values
+        # Split into equal bins of whole points; any leftover tail is kept as-is
+        values = np.asarray(values)
+        bin_size = -(-n // (max_points // 4))
+        n_binned = n // bin_size * bin_size
+        bins = values[:n_binned].reshape(-1, bin_size)
+        starts = np.arange(0, n_binned, bin_size)
+        
+        keep = np.unique(np.concatenate([
+            starts,
+            starts + bins.argmin(axis=1),
+            starts + bins.argmax(axis=1),
+            starts + bin_size - 1,
+            np.arange(n_binned, n),
+        ]))
+        return np.asarray(times)[keep], values[keep]
 
     def clear_caches(self):
         """Clear all cached data"""
@@ -1341,7 +1407,7 @@ class ParalyneReaderApp:
                     times = self.apply_time_offset_to_data(raw_times, file_info)
                     
                     # Check if we have datetime objects
-                    if times and isinstance(times[0], datetime):
+                    if len(times) and isinstance(times[0], datetime):
                         has_datetime = True
                     
                     # Apply any processing (smoothing, normalization)
@@ -1352,7 +1418,8 @@ class ParalyneReaderApp:
                     label = self.create_label(file_info)
                     
                     self.ax.plot(processed_times, processed_values, 
-                               color=color, label=label, linewidth=1.5)
+                               color=color, label=label, linewidth=1.5,
+                               rasterized=len(processed_values) > 500)
                     
                 except Exception as e:
                     logging.error(f"Error plotting file {file_info['filename']}: {str(e)}")